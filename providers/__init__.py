@@ -5,10 +5,21 @@ cloud-agnostic.  Currently supported: Google Drive, Dropbox.
 """
 from __future__ import annotations
 
+import json
+import os
 import re
 from typing import Protocol, runtime_checkable, Any
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # venvs created before orjson joined REQUIREMENTS
+    orjson = None
+
+
+_DRIVE_URL_RE = re.compile(r"drive\.google\.com|docs\.google\.com")
+_DROPBOX_URL_RE = re.compile(r"dropbox\.com")
+
 
 @runtime_checkable
 class StorageProvider(Protocol):
@@ -40,9 +51,12 @@ class StorageProvider(Protocol):
         """
         ...
 
-    def stream_audio(self, service: Any, file_id: str,
-                     audio_path: Path) -> None:
-        """Stream-extract audio from *file_id* directly into *audio_path*."""
+    def stream_audio(self, service: Any, file_id: str, audio_path: Path,
+                     mime_type: str | None = None) -> None:
+        """Stream-extract audio from *file_id* directly into *audio_path*.
+
+        *mime_type* (from the listing, if known) saves a metadata lookup.
+        """
         ...
 
     def download_file(self, service: Any, file_id: str,
@@ -72,7 +86,11 @@ class StorageProvider(Protocol):
 
     def list_existing_transcripts(self, service: Any,
                                   folder_id: str) -> set[str]:
-        """Return base-names that already have transcripts."""
+        """Return base-names that already have transcripts.
+
+        Audit/fallback path only: batch resumes skip files by the
+        manifest's source IDs, so the hot path never lists the folder.
+        """
         ...
 
     def get_folder_name(self, service: Any, folder_ref: str) -> str:
@@ -80,15 +98,64 @@ class StorageProvider(Protocol):
         ...
 
 
+def manifest_loads(data: bytes) -> dict:
+    """Parse manifest.json bytes (orjson when available, else stdlib json)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_all(f, chunk: bytes) -> None:
+    """Write all of *chunk* to an unbuffered ``io.FileIO``.
+
+    Skipping the buffered layer saves a copy per chunk, but raw writes
+    may be short, so loop until every byte is written.
+    """
+    view = memoryview(chunk)
+    while view:
+        view = view[f.write(view):]
+
+
+def manifest_dumps(manifest: dict) -> bytes:
+    """Serialize a manifest to indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+    return json.dumps(manifest, indent=2).encode("utf-8")
+
+
+# ffmpeg input options for URL sources: keep one persistent connection across
+# the range requests a moov-at-end MOV needs, and resume a dropped transfer
+# instead of failing the whole extraction.
+HTTP_INPUT_ARGS = [
+    "-reconnect", "1",
+    "-reconnect_streamed", "1",
+    "-reconnect_delay_max", "5",
+    "-multiple_requests", "1",
+]
+
+
+def audio_encode_args() -> list[str]:
+    """ffmpeg output options for the extracted audio track (mp3).
+
+    Defaults to high-quality VBR at the source rate.  Setting
+    ``TRANSCRIBE_AUDIO=speech`` downmixes to 16 kHz mono, the rate speech
+    models resample to anyway, which is far less for libmp3lame to encode.
+    """
+    args = ["-vn", "-acodec", "libmp3lame", "-q:a", "2"]
+    if os.environ.get("TRANSCRIBE_AUDIO", "").lower() == "speech":
+        args += ["-ac", "1", "-ar", "16000"]
+    return args
+
+
 def detect_provider(url_or_ref: str) -> str:
     """Auto-detect provider name from a URL or reference string.
 
     Returns ``"drive"`` or ``"dropbox"``.  Falls back to ``"drive"``
     for bare IDs (backward-compatible).
     """
-    if re.search(r"drive\.google\.com|docs\.google\.com", url_or_ref):
+    if _DRIVE_URL_RE.search(url_or_ref):
         return "drive"
-    if re.search(r"dropbox\.com", url_or_ref):
+    if _DROPBOX_URL_RE.search(url_or_ref):
         return "dropbox"
     # A Dropbox path always starts with "/"
     if url_or_ref.startswith("/"):
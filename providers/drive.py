@@ -2,18 +2,37 @@
 from __future__ import annotations
 
 import io
-import json
 import os
-import re
+import random
 import stat
+import string
 import subprocess
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait,
+)
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from urllib.parse import parse_qs, urlparse
 
+import httplib2
+import requests
+from google.auth.transport.requests import AuthorizedSession
 from google.auth.transport.requests import Request as AuthRequest
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build as build_service
-from googleapiclient.http import MediaIoBaseDownload, MediaFileUpload
+from googleapiclient.errors import HttpError
+from googleapiclient.http import (
+    MediaFileUpload, MediaIoBaseDownload, MediaIoBaseUpload, build_http,
+)
+
+from providers import (
+    HTTP_INPUT_ARGS, _write_all, audio_encode_args, manifest_dumps,
+    manifest_loads,
+)
 
 
 SCOPES = [
@@ -27,22 +46,131 @@ MOV_MIME_TYPES = [
     "video/x-matroska",
 ]
 
+FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+
+# Drive's query language has no ``mimeType in (...)`` form, so the filter
+# for "a video" is an or-chain, built once at import.
+_VIDEO_MIME_QUERY = " or ".join(f"mimeType='{m}'" for m in MOV_MIME_TYPES)
+# Characters that can appear in a Drive file/folder ID
+_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
+# Make calls see Shared Drive items, not just "My Drive"
+_ALL_DRIVES = {"supportsAllDrives": True}
+_ALL_DRIVES_LIST = {"supportsAllDrives": True, "includeItemsFromAllDrives": True}
+
+# Everything after the quoted folder ID in a per-folder listing query:
+# subfolders, plus videos minus macOS "._" AppleDouble files.  Drive's
+# name "contains" matches name terms rather than a literal prefix, so the
+# server clause may be stricter than the startswith("._") check in
+# _list_folders; it is kept off folders so it can never prune a subtree.
+_LIST_QUERY_SUFFIX = (
+    f" in parents and trashed=false and (mimeType='{FOLDER_MIME_TYPE}'"
+    f" or (({_VIDEO_MIME_QUERY}) and not name contains '._'))"
+)
+
+# Fields requested per listed entry.  Everything here is consumed: mimeType
+# splits folders from videos, and the main script copies createdTime,
+# modifiedTime and webViewLink into transcript headers and the manifest.
+_LIST_FIELDS = (
+    "nextPageToken, files(id, name, size, mimeType,"
+    " createdTime, modifiedTime, webViewLink)"
+)
+
+# Concurrent folder listings while walking a folder tree
+LIST_WORKERS = 8
+# Sibling folders listed per batch HTTP request
+LIST_BATCH_SIZE = 20
+# Drive's limit on calls packed into one batch HTTP request
+BATCH_MAX = 100
+
+# Retries (with jittered exponential backoff) for rate limits and 5xx
+API_RETRIES = 5
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+FILE_METADATA_FIELDS = (
+    "id, name, size, mimeType, createdTime, modifiedTime, webViewLink"
+)
+
+# Refresh the OAuth access token when it has less than this left
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+# Concurrent ffmpeg streams in process_many; ~4 saturate a 1 Gbit link
+STREAM_WORKERS = 4
+
+# Read size when streaming file content from Drive
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# (connect, read) timeouts for streamed media GETs, so a stalled transfer
+# errors out like the 60 s httplib2 timeout instead of hanging
+MEDIA_TIMEOUT = (10, 60)
+
+# Containers ffmpeg can demux from a non-seekable pipe.  MOV/MP4 may keep
+# the moov atom at the end, so those stay on ffmpeg's own HTTP reader,
+# which can seek with range requests.
+PIPEABLE_MIME_TYPES = {"video/x-msvideo", "video/x-matroska"}
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """True for Drive errors worth retrying: rate limits and 5xx.
+
+    403s are only retried for rate limiting, not e.g. downloadQuotaExceeded.
+    """
+    if not isinstance(exc, HttpError):
+        return False
+    status = exc.resp.status
+    if status in RETRYABLE_STATUSES:
+        return True
+    return status == 403 and b"ratelimitexceeded" in exc.content.lower()
+
+
+def _leading_id(text: str) -> str:
+    """Return the run of Drive ID characters ([A-Za-z0-9_-]) *text* starts with."""
+    for i, ch in enumerate(text):
+        if ch not in _ID_CHARS:
+            return text[:i]
+    return text
+
+
+def _media_error(resp) -> HttpError:
+    """Convert a failed streamed media response into an HttpError.
+
+    Keeps Drive's JSON error body (e.g. reason "downloadQuotaExceeded"),
+    which requests' raise_for_status() would drop.
+    """
+    content = resp.content  # error bodies are small JSON documents
+    resp.close()
+    info = httplib2.Response({"status": resp.status_code})
+    info.reason = resp.reason
+    return HttpError(info, content, uri=resp.url)
+
 
 class DriveProvider:
     """Google Drive implementation of the StorageProvider interface."""
 
     def __init__(self, script_dir: Path) -> None:
         self.script_dir = script_dir
+        self.token_path = script_dir / ".transcribe_drive_token.json"
+        # httplib2 is not thread-safe, so listing workers each get their own.
+        self._local = threading.local()
+        self._token_lock = threading.Lock()
+        # Long-lived so worker threads (and their keep-alive connections)
+        # survive across listings instead of reconnecting every call.
+        self._list_pool: ThreadPoolExecutor | None = None
+        # (parent_id, name) -> folder ID for folders found/created this run
+        self._subfolder_cache: dict[tuple[str, str], str] = {}
+        # folder ID -> Shared Drive ID (None for My Drive), see _list_scope
+        self._drive_ids: dict[str, str | None] = {}
 
     # -- auth ----------------------------------------------------------------
 
     def connect(self):
         """Build an authenticated Drive API service using OAuth client credentials."""
         client_secret = self.script_dir / "transcribe_client_secret.json"
-        token_path = self.script_dir / ".transcribe_drive_token.json"
         creds = None
-        if token_path.exists():
-            creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
+        if self.token_path.exists():
+            creds = Credentials.from_authorized_user_file(
+                str(self.token_path), SCOPES
+            )
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
                 creds.refresh(AuthRequest())
@@ -51,103 +179,272 @@ class DriveProvider:
                     str(client_secret), SCOPES
                 )
                 creds = flow.run_local_server(port=0)
-            token_path.write_text(creds.to_json())
-            os.chmod(token_path, stat.S_IRUSR | stat.S_IWUSR)  # 0600
+            self._save_token(creds)
         self._creds = creds
         return build_service("drive", "v3", credentials=creds)
 
+    def _save_token(self, creds: Credentials) -> None:
+        """Persist credentials so restarts can reuse the cached access token."""
+        self.token_path.write_text(creds.to_json())
+        os.chmod(self.token_path, stat.S_IRUSR | stat.S_IWUSR)  # 0600
+
+    def _ensure_fresh_token(self) -> None:
+        """Refresh the access token only if it is expired or about to expire."""
+        creds = self._creds
+        with self._token_lock:
+            # google-auth stores expiry as a naive UTC datetime
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            if (not creds.valid
+                    or (creds.expiry
+                        and creds.expiry - now < TOKEN_REFRESH_MARGIN)):
+                creds.refresh(AuthRequest())
+                self._save_token(creds)
+
     # -- folder / file helpers -----------------------------------------------
 
     def extract_folder_ref(self, url_or_id: str) -> str:
         """Extract a Google Drive folder ID from a URL or bare ID."""
-        m = re.search(r"folders/([a-zA-Z0-9_-]+)", url_or_id)
-        if m:
-            return m.group(1)
-        m = re.search(r"[?&]id=([a-zA-Z0-9_-]+)", url_or_id)
-        if m:
-            return m.group(1)
-        return url_or_id.strip()
+        url_or_id = url_or_id.strip()
+        if "folders/" in url_or_id:
+            folder_id = _leading_id(url_or_id.rsplit("folders/", 1)[1])
+            if folder_id:
+                return folder_id
+        if "id=" in url_or_id:
+            ids = parse_qs(urlparse(url_or_id).query).get("id")
+            if ids and _leading_id(ids[0]):
+                return _leading_id(ids[0])
+        return url_or_id
 
     def get_file_metadata(self, service, file_id: str) -> dict:
         """Return metadata dict for a single Drive file."""
         return service.files().get(
-            fileId=file_id,
-            fields=(
-                "id, name, size, mimeType, createdTime,"
-                " modifiedTime, webViewLink"
-            ),
-        ).execute()
+            fileId=file_id, fields=FILE_METADATA_FIELDS, **_ALL_DRIVES
+        ).execute(num_retries=API_RETRIES)
+
+    def get_file_metadata_many(self, service,
+                               file_ids: list[str]) -> dict[str, dict]:
+        """Return {file_id: metadata} for many files using batch requests.
+
+        Costs one HTTP round-trip per 100 files instead of one per file.
+        """
+        results: dict[str, dict] = {}
+        for i in range(0, len(file_ids), BATCH_MAX):
+            results.update(self._execute_batch(service, {
+                fid: service.files().get(
+                    fileId=fid, fields=FILE_METADATA_FIELDS, **_ALL_DRIVES
+                )
+                for fid in file_ids[i:i + BATCH_MAX]
+            }))
+        return results
+
+    def _execute_batch(self, service, requests: dict, http=None) -> dict:
+        """Run {request_id: HttpRequest} as one batch HTTP request.
+
+        Calls that fail with a rate-limit or server error are re-sent in a
+        follow-up batch after a jittered exponential backoff; any other
+        failure is raised.  Returns {request_id: response}.
+        """
+        responses: dict[str, dict] = {}
+        failed: dict[str, Exception] = {}
+
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                failed[request_id] = exception
+            else:
+                responses[request_id] = response
+
+        for attempt in range(API_RETRIES + 1):
+            batch = service.new_batch_http_request(callback=_collect)
+            for request_id, request in requests.items():
+                batch.add(request, request_id=request_id)
+            failed.clear()
+            try:
+                batch.execute(http=http)
+            except HttpError as e:
+                if not _is_retryable(e) or attempt == API_RETRIES:
+                    raise
+                failed.update(dict.fromkeys(requests, e))
+            for exc in failed.values():
+                if not _is_retryable(exc) or attempt == API_RETRIES:
+                    raise exc
+            if not failed:
+                break
+            requests = {rid: requests[rid] for rid in failed}
+            time.sleep(random.uniform(0, min(60, 2 ** attempt)))
+        return responses
+
+    def _thread_http(self) -> AuthorizedHttp:
+        """Return an authorized HTTP client private to the calling thread."""
+        http = getattr(self._local, "http", None)
+        if http is None:
+            # build_http: same 60 s socket timeout and redirect handling
+            # as the client build_service creates
+            http = AuthorizedHttp(self._creds, http=build_http())
+            self._local.http = http
+        return http
+
+    def _listing_pool(self) -> ThreadPoolExecutor:
+        """Return the shared listing thread pool, creating it on first use."""
+        if self._list_pool is None:
+            self._list_pool = ThreadPoolExecutor(
+                max_workers=LIST_WORKERS, thread_name_prefix="drive-list"
+            )
+        return self._list_pool
+
+    def _thread_session(self) -> AuthorizedSession:
+        """Return an authorized requests session private to the calling thread."""
+        sess = getattr(self._local, "session", None)
+        if sess is None:
+            sess = AuthorizedSession(self._creds)
+            self._local.session = sess
+        return sess
+
+    def _drive_id(self, service, folder_id: str) -> str | None:
+        """Return the Shared Drive containing *folder_id* (None for My Drive).
+
+        Cached, and inherited by subfolders found or created under a known
+        folder, so a run pays one lookup per root folder.
+        """
+        if folder_id not in self._drive_ids:
+            self._drive_ids[folder_id] = service.files().get(
+                fileId=folder_id, fields="driveId", **_ALL_DRIVES
+            ).execute(num_retries=API_RETRIES).get("driveId")
+        return self._drive_ids[folder_id]
+
+    def _list_scope(self, service, folder_id: str) -> dict:
+        """files().list kwargs for querying the children of *folder_id*.
+
+        Shared Drive folders need corpora="drive" with their driveId: the
+        default "user" corpus can leave out Shared Drive files the user
+        has not opened, so lookups there could miss e.g. the manifest.
+        """
+        scope = dict(_ALL_DRIVES_LIST)
+        drive_id = self._drive_id(service, folder_id)
+        if drive_id:
+            scope.update(corpora="drive", driveId=drive_id)
+        return scope
+
+    def _list_folders(self, service, folders: list[tuple[str, str]],
+                      drive_id: str | None = None,
+                      ) -> dict[str, tuple[list[dict], list[dict]]]:
+        """List several folders' videos and subfolders via HTTP batch requests.
+
+        *folders* is a list of (folder_id, path) pairs.  Each round sends
+        one page request per unfinished folder in a single batch, so a
+        group of folders usually costs one round-trip.  Returns
+        {folder_id: (videos, subfolders)}.  Runs on a listing worker thread.
+        *drive_id* scopes the queries to that Shared Drive.
+        """
+        scope = dict(_ALL_DRIVES_LIST)
+        if drive_id:
+            scope.update(corpora="drive", driveId=drive_id)
+        paths = dict(folders)
+        listings: dict[str, tuple[list[dict], list[dict]]] = {
+            fid: ([], []) for fid in paths
+        }
+        page_tokens: dict[str, str | None] = {fid: None for fid in paths}
+        while page_tokens:
+            responses = self._execute_batch(service, {
+                fid: service.files().list(
+                    q=f"'{fid}'{_LIST_QUERY_SUFFIX}",
+                    fields=_LIST_FIELDS,
+                    pageSize=1000,
+                    orderBy="folder,name",
+                    pageToken=page_token,
+                    **scope,
+                )
+                for fid, page_token in page_tokens.items()
+            }, http=self._thread_http())
+
+            page_tokens = {}
+            for fid, resp in responses.items():
+                videos, subfolders = listings[fid]
+                path = paths[fid]
+                for f in resp.get("files", []):
+                    if f["mimeType"] == FOLDER_MIME_TYPE:
+                        f["_folder_path"] = f"{path}{f['name']}/"
+                        subfolders.append(f)
+                        continue
+                    if f["name"].startswith("._"):
+                        continue
+                    f["_folder_path"] = path
+                    videos.append(f)
+                if resp.get("nextPageToken"):
+                    page_tokens[fid] = resp["nextPageToken"]
+        return listings
 
     def list_video_files(self, service, folder_id: str,
                          _path: str = "") -> list[dict]:
-        """List video files in a Drive folder, recursing into subfolders."""
-        mime_query = " or ".join(f"mimeType='{m}'" for m in MOV_MIME_TYPES)
-        query = f"'{folder_id}' in parents and ({mime_query}) and trashed=false"
-        files: list[dict] = []
-        page_token = None
-        while True:
-            resp = service.files().list(
-                q=query,
-                fields=(
-                    "nextPageToken, files(id, name, size, mimeType,"
-                    " createdTime, modifiedTime, webViewLink)"
-                ),
-                pageSize=100,
-                orderBy="name",
-                pageToken=page_token,
-            ).execute()
-            for f in resp.get("files", []):
-                if f["name"].startswith("._"):
-                    continue
-                f["_folder_path"] = _path
-                files.append(f)
-            page_token = resp.get("nextPageToken")
-            if not page_token:
-                break
+        """List video files in a Drive folder, recursing into subfolders.
 
-        # Recurse into subfolders
-        sub_query = (
-            f"'{folder_id}' in parents"
-            " and mimeType='application/vnd.google-apps.folder'"
-            " and trashed=false"
-        )
-        page_token = None
-        while True:
-            resp = service.files().list(
-                q=sub_query,
-                fields="nextPageToken, files(id, name)",
-                pageSize=100,
-                orderBy="name",
-                pageToken=page_token,
-            ).execute()
-            for sf in resp.get("files", []):
-                sub_path = f"{_path}{sf['name']}/" if _path else f"{sf['name']}/"
-                files.extend(self.list_video_files(service, sf["id"], sub_path))
-            page_token = resp.get("nextPageToken")
-            if not page_token:
-                break
+        Folders are listed breadth-first on a thread pool, siblings grouped
+        into batch requests, then stitched back together depth-first so
+        the order matches a recursive walk: a folder's own videos by name,
+        then each subfolder by name.
+        """
+        # Folders inside a Shared Drive are listed with corpora="drive"
+        drive_id = self._drive_id(service, folder_id)
+        listings: dict[str, tuple[list[dict], list[dict]]] = {}
+        pool = self._listing_pool()
+        pending = {
+            pool.submit(
+                self._list_folders, service, [(folder_id, _path)], drive_id
+            ),
+        }
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                result = fut.result()
+                listings.update(result)
+                for parent_id, (_, subfolders) in result.items():
+                    # Pre-warm ensure_subfolder with what we just listed
+                    for sf in subfolders:
+                        self._subfolder_cache[(parent_id, sf["name"])] = sf["id"]
+                        self._drive_ids[sf["id"]] = drive_id
+                    children = [
+                        (sf["id"], sf["_folder_path"]) for sf in subfolders
+                    ]
+                    for i in range(0, len(children), LIST_BATCH_SIZE):
+                        pending.add(pool.submit(
+                            self._list_folders, service,
+                            children[i:i + LIST_BATCH_SIZE], drive_id,
+                        ))
 
+        files: list[dict] = []
+        stack = [folder_id]
+        while stack:
+            videos, subfolders = listings[stack.pop()]
+            files.extend(videos)
+            stack.extend(sf["id"] for sf in reversed(subfolders))
         return files
 
     def get_folder_name(self, service, folder_id: str) -> str:
         """Return the Drive folder's display name."""
-        meta = service.files().get(fileId=folder_id, fields="name").execute()
+        meta = service.files().get(
+            fileId=folder_id, fields="name", **_ALL_DRIVES
+        ).execute(num_retries=API_RETRIES)
         return meta["name"]
 
     def list_existing_transcripts(self, service, folder_id: str) -> set[str]:
-        """Return set of base names that already have transcripts."""
+        """Return set of base names that already have transcripts.
+
+        Lists the folder on every call; an audit/fallback path, since
+        batch resumes skip files by the manifest's source IDs.
+        """
         query = (
             f"'{folder_id}' in parents and mimeType='text/plain' and trashed=false"
         )
         names: set[str] = set()
+        scope = self._list_scope(service, folder_id)
         page_token = None
         while True:
             resp = service.files().list(
                 q=query,
                 fields="nextPageToken, files(name)",
-                pageSize=100,
+                pageSize=1000,
                 pageToken=page_token,
-            ).execute()
+                **scope,
+            ).execute(num_retries=API_RETRIES)
             for f in resp.get("files", []):
                 names.add(Path(f["name"]).stem)
             page_token = resp.get("nextPageToken")
@@ -157,26 +454,41 @@ class DriveProvider:
 
     # -- download / stream ---------------------------------------------------
 
-    def stream_audio(self, service, file_id: str, audio_path: Path) -> None:
-        """Stream audio extraction directly from Drive via ffmpeg."""
-        self._creds.refresh(AuthRequest())
+    def stream_audio(self, service, file_id: str, audio_path: Path,
+                     mime_type: str | None = None) -> None:
+        """Stream audio extraction directly from Drive via ffmpeg.
 
-        url = f"https://www.googleapis.com/drive/v3/files/{file_id}?alt=media"
-        print(f"  Streaming audio extraction → {audio_path.name}...")
-        result = subprocess.run(
-            [
-                "ffmpeg",
-                "-headers", f"Authorization: Bearer {self._creds.token}\r\n",
-                "-i", url,
-                "-vn",
-                "-acodec", "libmp3lame",
-                "-q:a", "2",
-                "-y",
-                str(audio_path),
-            ],
-            capture_output=True,
-            text=True,
+        Pipe-friendly containers are downloaded by Python and fed to
+        ffmpeg's stdin; MOV/MP4 are read by ffmpeg over HTTP so it can seek.
+        Pass the listing's *mime_type* to skip looking it up.
+        """
+        self._ensure_fresh_token()
+
+        url = (
+            f"https://www.googleapis.com/drive/v3/files/{file_id}"
+            "?alt=media&supportsAllDrives=true"
         )
+        encode_args = audio_encode_args() + ["-y", str(audio_path)]
+        if not mime_type:
+            mime_type = service.files().get(
+                fileId=file_id, fields="mimeType", **_ALL_DRIVES
+            ).execute(
+                http=self._thread_http(), num_retries=API_RETRIES
+            )["mimeType"]
+        print(f"  Streaming audio extraction → {audio_path.name}...")
+        if mime_type in PIPEABLE_MIME_TYPES:
+            result = self._pipe_to_ffmpeg(url, encode_args)
+        else:
+            result = subprocess.run(
+                [
+                    "ffmpeg",
+                    "-headers", f"Authorization: Bearer {self._creds.token}\r\n",
+                    *HTTP_INPUT_ARGS,
+                    "-i", url,
+                ] + encode_args,
+                capture_output=True,
+                text=True,
+            )
         if result.returncode != 0:
             if "403" in result.stderr or "Forbidden" in result.stderr:
                 raise PermissionError(
@@ -189,17 +501,119 @@ class DriveProvider:
         size_mb = audio_path.stat().st_size / 1e6
         print(f"  Audio extracted: {size_mb:.1f} MB (streamed)")
 
+    def process_many(self, service, file_ids: list[str], audio_dir: Path,
+                     workers: int = STREAM_WORKERS
+                     ) -> tuple[dict[str, Path], dict[str, Exception]]:
+        """Run stream_audio for many files concurrently.
+
+        Writes ``<file_id>.mp3`` into *audio_dir*.  Returns
+        (audio_paths, errors), both keyed by file ID; one file failing
+        does not stop the others.
+        """
+        audio_paths: dict[str, Path] = {}
+        errors: dict[str, Exception] = {}
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(
+                    self.stream_audio, service, fid, audio_dir / f"{fid}.mp3"
+                ): fid
+                for fid in file_ids
+            }
+            for fut in as_completed(futures):
+                fid = futures[fut]
+                try:
+                    fut.result()
+                    audio_paths[fid] = audio_dir / f"{fid}.mp3"
+                except Exception as e:
+                    print(f"  ERROR streaming {fid}: {e}")
+                    errors[fid] = e
+        return audio_paths, errors
+
+    def _pipe_to_ffmpeg(self, url: str,
+                        encode_args: list[str]) -> subprocess.CompletedProcess:
+        """Download *url* in Python and pump the bytes into ffmpeg's stdin.
+
+        Download failures raise PermissionError (403) or RuntimeError, the
+        errors the caller answers with a full-download fallback.
+        """
+        try:
+            resp = self._thread_session().get(
+                url, stream=True, timeout=MEDIA_TIMEOUT
+            )
+        except requests.RequestException as e:
+            raise RuntimeError(f"Drive download failed: {e}") from e
+        if resp.status_code == 403:
+            raise PermissionError(
+                "Drive download refused (will retry with full download):"
+                f" {_media_error(resp)}"
+            )
+        if not resp.ok:
+            err = _media_error(resp)
+            raise RuntimeError(f"Drive download failed: {err}") from err
+
+        args = ["ffmpeg", "-i", "pipe:0"] + encode_args
+        try:
+            proc = subprocess.Popen(
+                args,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+        except Exception:
+            resp.close()
+            raise
+        pump_error: list[Exception] = []
+
+        def _pump():
+            try:
+                for chunk in resp.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    proc.stdin.write(chunk)
+            except BrokenPipeError:
+                pass  # ffmpeg exited early; its stderr says why
+            except Exception as e:
+                pump_error.append(e)
+            finally:
+                resp.close()
+                try:
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    pass
+
+        pump = threading.Thread(target=_pump, daemon=True)
+        pump.start()
+        stderr = proc.stderr.read().decode("utf-8", errors="replace")
+        returncode = proc.wait()
+        pump.join()
+        if pump_error:
+            raise RuntimeError(f"Drive download failed: {pump_error[0]}")
+        return subprocess.CompletedProcess(args, returncode, stderr=stderr)
+
     def download_file(self, service, file_id: str, dest_path: Path) -> None:
-        """Download a Drive file to local disk with progress."""
-        request = service.files().get_media(fileId=file_id)
-        with open(dest_path, "wb") as f:
-            downloader = MediaIoBaseDownload(f, request, chunksize=50 * 1024 * 1024)
-            done = False
-            while not done:
-                status, done = downloader.next_chunk()
-                if status:
-                    pct = int(status.progress() * 100)
-                    print(f"  Downloading... {pct}%", end="\r")
+        """Download a Drive file to local disk with progress.
+
+        Uses a single streamed GET rather than MediaIoBaseDownload, which
+        issues a separate ranged request per chunk.
+        """
+        url = (
+            f"https://www.googleapis.com/drive/v3/files/{file_id}"
+            "?alt=media&supportsAllDrives=true"
+        )
+        with self._thread_session().get(
+            url, stream=True, timeout=MEDIA_TIMEOUT
+        ) as resp:
+            if not resp.ok:
+                raise _media_error(resp)
+            total = int(resp.headers.get("Content-Length", 0))
+            received = 0
+            last_pct = -1
+            with io.FileIO(dest_path, "wb") as f:
+                for chunk in resp.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    _write_all(f, chunk)
+                    received += len(chunk)
+                    pct = received * 100 // total if total else 0
+                    if pct != last_pct:
+                        print(f"  Downloading... {pct}%", end="\r")
+                        last_pct = pct
         print(
             f"  Downloaded: {dest_path.name}"
             f" ({dest_path.stat().st_size / 1e9:.1f} GB)"
@@ -211,15 +625,34 @@ class DriveProvider:
                     mime_type: str, file_id: str | None = None) -> str:
         """Upload a local file to a Drive folder.  Returns file ID."""
         media = MediaFileUpload(str(local_path), mimetype=mime_type, resumable=True)
+        return self._upload_media(
+            service, folder_id, local_path.name, media, file_id
+        )
+
+    def upload_bytes(self, service, folder_id: str, name: str, data: bytes,
+                     mime_type: str, file_id: str | None = None) -> str:
+        """Upload in-memory *data* as *name* in a Drive folder.  Returns file ID.
+
+        Uses a simple (non-resumable) upload, which skips the session
+        handshake round-trip; meant for small payloads like the manifest.
+        """
+        media = MediaIoBaseUpload(
+            io.BytesIO(data), mimetype=mime_type, resumable=False
+        )
+        return self._upload_media(service, folder_id, name, media, file_id)
+
+    def _upload_media(self, service, folder_id: str, name: str, media,
+                      file_id: str | None) -> str:
+        """Create or update a Drive file from a media upload object."""
         if file_id:
             f = service.files().update(
-                fileId=file_id, media_body=media, fields="id"
-            ).execute()
+                fileId=file_id, media_body=media, fields="id", **_ALL_DRIVES
+            ).execute(num_retries=API_RETRIES)
         else:
-            meta = {"name": local_path.name, "parents": [folder_id]}
+            meta = {"name": name, "parents": [folder_id]}
             f = service.files().create(
-                body=meta, media_body=media, fields="id"
-            ).execute()
+                body=meta, media_body=media, fields="id", **_ALL_DRIVES
+            ).execute(num_retries=API_RETRIES)
         return f["id"]
 
     # -- manifest ------------------------------------------------------------
@@ -231,18 +664,22 @@ class DriveProvider:
             f"'{output_folder_id}' in parents"
             " and name='manifest.json' and trashed=false"
         )
-        resp = service.files().list(q=query, fields="files(id)").execute()
+        resp = service.files().list(
+            q=query, fields="files(id)", pageSize=1,
+            **self._list_scope(service, output_folder_id),
+        ).execute(num_retries=API_RETRIES)
         existing = resp.get("files", [])
         if existing:
             manifest_file_id = existing[0]["id"]
-            request = service.files().get_media(fileId=manifest_file_id)
+            request = service.files().get_media(
+                fileId=manifest_file_id, **_ALL_DRIVES
+            )
             buf = io.BytesIO()
             downloader = MediaIoBaseDownload(buf, request)
             done = False
             while not done:
-                _, done = downloader.next_chunk()
-            buf.seek(0)
-            manifest = json.loads(buf.read().decode("utf-8"))
+                _, done = downloader.next_chunk(num_retries=API_RETRIES)
+            manifest = manifest_loads(buf.getvalue())
             return manifest, manifest_file_id
         return {
             "source_folder_id": output_folder_id,
@@ -253,35 +690,44 @@ class DriveProvider:
     def save_manifest(self, service, output_folder_id: str, manifest: dict,
                       manifest_file_id: str | None) -> str:
         """Write manifest.json to Drive."""
-        tmp_dir = Path("/tmp/transcribe_drive")
-        tmp_dir.mkdir(parents=True, exist_ok=True)
-        tmp_path = tmp_dir / "manifest.json"
-        tmp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
-        file_id = self.upload_file(
-            service, output_folder_id, tmp_path, "application/json",
+        return self.upload_bytes(
+            service, output_folder_id, "manifest.json",
+            manifest_dumps(manifest), "application/json",
             file_id=manifest_file_id,
         )
-        tmp_path.unlink(missing_ok=True)
-        return file_id
 
     # -- subfolders ----------------------------------------------------------
 
     def ensure_subfolder(self, service, parent_id: str, name: str) -> str:
         """Find or create a subfolder under parent_id."""
+        key = (parent_id, name)
+        if key in self._subfolder_cache:
+            return self._subfolder_cache[key]
         safe_name = name.replace("\\", "\\\\").replace("'", "\\'")
         query = (
             f"'{parent_id}' in parents"
             " and mimeType='application/vnd.google-apps.folder'"
             f" and name='{safe_name}' and trashed=false"
         )
-        resp = service.files().list(q=query, fields="files(id)").execute()
+        resp = service.files().list(
+            q=query, fields="files(id)", pageSize=1,
+            **self._list_scope(service, parent_id),
+        ).execute(num_retries=API_RETRIES)
         existing = resp.get("files", [])
+        # A subfolder lives in the same drive as its parent
+        drive_id = self._drive_ids[parent_id]
         if existing:
+            self._subfolder_cache[key] = existing[0]["id"]
+            self._drive_ids[existing[0]["id"]] = drive_id
             return existing[0]["id"]
         meta = {
             "name": name,
             "mimeType": "application/vnd.google-apps.folder",
             "parents": [parent_id],
         }
-        folder = service.files().create(body=meta, fields="id").execute()
+        folder = service.files().create(
+            body=meta, fields="id", **_ALL_DRIVES
+        ).execute(num_retries=API_RETRIES)
+        self._subfolder_cache[key] = folder["id"]
+        self._drive_ids[folder["id"]] = drive_id
         return folder["id"]
@@ -1,24 +1,176 @@
 """Dropbox storage provider for transcribe_drive."""
 from __future__ import annotations
 
+import contextlib
+import functools
+import io
 import json
 import os
+import queue
+import re
 import stat
 import subprocess
+import threading
 import time
+import urllib.parse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from operator import itemgetter
 from pathlib import Path
+from typing import Iterable, Iterator
 
 import dropbox
-from dropbox.exceptions import ApiError, AuthError
-from dropbox.files import WriteMode
+from dropbox.exceptions import (
+    ApiError, AuthError, BadInputError, RateLimitError,
+)
+from dropbox.files import (
+    DeletedMetadata, FileMetadata, FolderMetadata, WriteMode,
+)
+
+from providers import (
+    HTTP_INPUT_ARGS, _write_all, audio_encode_args, manifest_dumps,
+    manifest_loads,
+)
 
 
 # Video extensions to look for (Dropbox doesn't have MIME-based queries)
-VIDEO_EXTENSIONS = {".mov", ".mp4", ".avi", ".mkv"}
+VIDEO_EXTENSIONS = frozenset({".mov", ".mp4", ".avi", ".mkv"})
+
+# Dropbox URL shapes accepted by extract_folder_ref
+_SCL_RE = re.compile(r"dropbox\.com/scl/fo/")
+_HOME_RE = re.compile(r"dropbox\.com/home(/[^?#]*)")
+_SH_RE = re.compile(r"dropbox\.com/sh?/[^/]+/[^/]+(/[^?#]*)?")
 
 # Dropbox chunked upload threshold (150 MB)
 CHUNK_SIZE = 150 * 1024 * 1024
 
+# Read size for streamed downloads
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Concurrent folder listings while walking a shared link
+LIST_WORKERS = 8
+
+# Concurrent files_get_metadata calls in get_file_metadata_many
+METADATA_WORKERS = 8
+
+# Parallel data uploads in upload_files_batch, and Dropbox's limit on
+# sessions committed by one finish_batch call
+UPLOAD_WORKERS = 8
+UPLOAD_BATCH_MAX = 1000
+
+# Dropbox's limit on paths per files_create_folder_batch call
+CREATE_FOLDER_BATCH_MAX = 10000
+
+# HTTP connection pool size for the Dropbox client, enough for the
+# listing and upload thread pools to keep their connections alive
+POOL_SIZE = 16
+
+# files_list_folder options: biggest pages (limit is approximate, max 2000)
+# and no per-entry extras we never read.  Mounted folders stay included
+# so videos in shared/team folders under the path are still found.
+LIST_FOLDER_KWARGS = {
+    "limit": 2000,
+    "include_media_info": False,
+    "include_has_explicit_shared_members": False,
+}
+
+
+def _read_json(path: Path) -> dict:
+    """Load a JSON object from *path*, or {} if missing/unreadable."""
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_json_atomic(path: Path, data: dict) -> None:
+    """Write *data* as JSON via a temp file + rename (0600)."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(data))
+    os.chmod(tmp, stat.S_IRUSR | stat.S_IWUSR)  # 0600
+    os.replace(tmp, path)
+
+
+def _prefetch_chunks(f, chunk_size: int) -> Iterator[bytes]:
+    """Yield *chunk_size* blocks of *f*, reading the next one in the background.
+
+    Exactly one read is in flight while the consumer works on the current
+    block (e.g. an upload request), so at most two blocks are alive.  The
+    next read is only started once the consumer asks for another block.
+    """
+    with ThreadPoolExecutor(max_workers=1) as reader:
+        pending = reader.submit(f.read, chunk_size)
+        # Leaving the with-block waits for the in-flight read, so *f* is no
+        # longer in use once the generator is closed (callers close it
+        # before closing *f*).
+        while True:
+            block = pending.result()
+            if not block:
+                return
+            pending = reader.submit(f.read, chunk_size)
+            yield block
+            del block
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_folder_ref(url_or_path: str) -> str:
+    """Cached parser behind DropboxProvider.extract_folder_ref."""
+    # New-style shared folder links (/scl/fo/) — return URL unchanged;
+    # list_video_files will pass it as a SharedLink to the API.
+    if _SCL_RE.search(url_or_path):
+        return url_or_path.strip()
+
+    # Dropbox home URLs
+    m = _HOME_RE.search(url_or_path)
+    if m:
+        return urllib.parse.unquote(m.group(1))
+
+    # Legacy shared URLs (/sh/ or /s/)
+    m = _SH_RE.search(url_or_path)
+    if m and m.group(1):
+        return urllib.parse.unquote(m.group(1))
+
+    # Assume it's already a bare path
+    path = url_or_path.strip()
+    if path == "/":
+        return ""
+    return path
+
+
+def _write_behind(path: Path, chunks: Iterable[bytes]) -> None:
+    """Write *chunks* to *path*, doing the disk writes on a background thread.
+
+    The download counterpart of _prefetch_chunks: at most one chunk is
+    queued, so fetching the next chunk overlaps writing the previous one.
+    """
+    blocks: queue.Queue = queue.Queue(maxsize=1)
+    error: list[Exception] = []
+
+    def _writer() -> None:
+        try:
+            with io.FileIO(path, "wb") as f:
+                while True:
+                    block = blocks.get()
+                    if block is None:
+                        return
+                    _write_all(f, block)
+        except Exception as e:
+            error.append(e)
+            while blocks.get() is not None:
+                pass  # keep the producer from blocking until it stops
+
+    writer = threading.Thread(target=_writer, daemon=True)
+    writer.start()
+    try:
+        for chunk in chunks:
+            if error:
+                break
+            blocks.put(chunk)
+    finally:
+        blocks.put(None)
+        writer.join()
+    if error:
+        raise error[0]
+
 
 class DropboxProvider:
     """Dropbox implementation of the StorageProvider interface."""
@@ -26,6 +178,20 @@ class DropboxProvider:
     def __init__(self, script_dir: Path) -> None:
         self.script_dir = script_dir
         self.token_path = script_dir / ".transcribe_dropbox_token.json"
+        # Per-folder {"cursor", "names"}: a listing cursor saved together
+        # with the .txt stems it produced, so list_existing_transcripts
+        # can fetch only deltas.
+        self.transcript_index_path = (
+            script_dir / ".transcribe_dropbox_txt_index.json"
+        )
+        # One long-lived client per provider: reuses its pooled session
+        # (warm TLS connections) for every call.
+        self._dbx: dropbox.Dropbox | None = None
+        # Lowercased parent path -> lowercased subfolder names, filled by
+        # one listing per parent in ensure_subfolder.
+        self._children_cache: dict[str, set[str]] = {}
+        # Shared-link URL -> folder name, resolved once per run.
+        self._folder_name_cache: dict[str, str] = {}
         # Set when listing a shared folder URL; used by stream_audio fallback.
         self._shared_url: str | None = None
 
@@ -36,8 +202,10 @@ class DropboxProvider:
 
         Uses OAuth2 with offline refresh tokens.  On first run, prints an
         auth URL for the user to visit and paste the authorization code.
+        The client is cached, so repeat calls return the same instance.
         """
-        import os
+        if self._dbx is not None:
+            return self._dbx
 
         app_key = os.getenv("DROPBOX_APP_KEY")
         app_secret = os.getenv("DROPBOX_APP_SECRET")
@@ -56,10 +224,12 @@ class DropboxProvider:
                     oauth2_refresh_token=refresh_token,
                     app_key=app_key,
                     app_secret=app_secret,
+                    session=dropbox.create_session(max_connections=POOL_SIZE),
                 )
                 # Validate the connection
                 try:
                     dbx.users_get_current_account()
+                    self._dbx = dbx
                     return dbx
                 except AuthError:
                     print("  Saved Dropbox token is invalid, re-authenticating...")
@@ -82,11 +252,13 @@ class DropboxProvider:
         os.chmod(self.token_path, stat.S_IRUSR | stat.S_IWUSR)  # 0600
         print("  Dropbox token saved for future use.")
 
-        return dropbox.Dropbox(
+        self._dbx = dropbox.Dropbox(
             oauth2_refresh_token=result.refresh_token,
             app_key=app_key,
             app_secret=app_secret,
+            session=dropbox.create_session(max_connections=POOL_SIZE),
         )
+        return self._dbx
 
     # -- folder / file helpers -----------------------------------------------
 
@@ -100,29 +272,7 @@ class DropboxProvider:
         - Dropbox shared folder links: https://www.dropbox.com/scl/fo/...
           (returned as-is; list_video_files resolves via SharedLink API)
         """
-        import re
-        import urllib.parse
-
-        # New-style shared folder links (/scl/fo/) — return URL unchanged;
-        # list_video_files will pass it as a SharedLink to the API.
-        if re.search(r"dropbox\.com/scl/fo/", url_or_path):
-            return url_or_path.strip()
-
-        # Dropbox home URLs
-        m = re.search(r"dropbox\.com/home(/[^?#]*)", url_or_path)
-        if m:
-            return urllib.parse.unquote(m.group(1))
-
-        # Legacy shared URLs (/sh/ or /s/)
-        m = re.search(r"dropbox\.com/sh?/[^/]+/[^/]+(/[^?#]*)?", url_or_path)
-        if m and m.group(1):
-            return urllib.parse.unquote(m.group(1))
-
-        # Assume it's already a bare path
-        path = url_or_path.strip()
-        if path == "/":
-            return ""
-        return path
+        return _parse_folder_ref(url_or_path)
 
     def get_file_metadata(self, service, file_path: str) -> dict:
         """Return metadata dict for a single Dropbox file."""
@@ -142,11 +292,26 @@ class DropboxProvider:
             "_folder_path": str(Path(meta.path_display).parent) + "/",
         }
 
+    def get_file_metadata_many(self, service,
+                               file_paths: list[str]) -> dict[str, dict]:
+        """Return {file_path: metadata} for many files.
+
+        Dropbox has no batch metadata endpoint, so the lookups run
+        concurrently on a thread pool over the shared pooled client.
+        """
+        paths = list(dict.fromkeys(file_paths))
+        with ThreadPoolExecutor(max_workers=METADATA_WORKERS) as pool:
+            metas = pool.map(
+                lambda p: self.get_file_metadata(service, p), paths
+            )
+            return dict(zip(paths, metas))
+
     def list_video_files(self, service, folder_path: str,
                          _path: str = "") -> list[dict]:
         """List video files under *folder_path*, recursing into subfolders.
 
-        For bare Dropbox paths, uses recursive=True for efficiency.
+        For bare Dropbox paths, uses recursive=True for efficiency (or
+        files_search_v2 when DROPBOX_SEARCH_LISTING=1).
         For shared folder links (https://), recurses manually because
         the Dropbox API does not support recursive=True with shared links.
         """
@@ -154,73 +319,166 @@ class DropboxProvider:
 
         if is_shared_link:
             self._shared_url = folder_path  # remember for stream_audio fallback
-            return self._list_shared_link_recursive(service, folder_path)
-
+            entries = self._list_shared_link_recursive(service, folder_path)
+        else:
+            entries = None
+            if os.environ.get("DROPBOX_SEARCH_LISTING") == "1":
+                entries = self._search_video_files(service, folder_path)
+            if entries is None:
+                entries = self._list_recursive(service, folder_path)
+
+        entries.sort(key=itemgetter("name"))
+        return entries
+
+    def _list_recursive(self, service,
+                        folder_path: str) -> list[dict]:
+        """List videos under a bare path with one recursive=True listing."""
         files: list[dict] = []
         try:
-            result = service.files_list_folder(folder_path, recursive=True)
+            result = service.files_list_folder(
+                folder_path, recursive=True, **LIST_FOLDER_KWARGS
+            )
         except ApiError as e:
             print(f"  Dropbox API error listing folder: {e}")
             return files
 
         while True:
             for entry in result.entries:
-                if not isinstance(entry, dropbox.files.FileMetadata):
-                    continue
-                ext = Path(entry.name).suffix.lower()
-                if ext not in VIDEO_EXTENSIONS:
-                    continue
-                if entry.name.startswith("._"):
-                    continue
-
-                rel_path = entry.path_display
-                if folder_path:
-                    rel_path = rel_path[len(folder_path):]
-                rel_dir = str(Path(rel_path).parent).lstrip("/")
-                if rel_dir and not rel_dir.endswith("/"):
-                    rel_dir += "/"
-                elif rel_dir == ".":
-                    rel_dir = ""
-
-                files.append({
-                    "id": entry.path_display,
-                    "name": entry.name,
-                    "size": entry.size,
-                    "mimeType": "",
-                    "createdTime": "",
-                    "modifiedTime": (
-                        entry.client_modified.isoformat() + "Z"
-                        if entry.client_modified else ""
-                    ),
-                    "webViewLink": "",
-                    "_folder_path": rel_dir,
-                })
+                if type(entry) is FileMetadata:
+                    video = self._video_entry(entry, folder_path)
+                    if video is not None:
+                        files.append(video)
 
             if not result.has_more:
                 break
             result = service.files_list_folder_continue(result.cursor)
 
-        files.sort(key=lambda f: f["name"])
         return files
 
-    def _list_shared_link_recursive(self, service, shared_url: str,
-                                    subfolder: str = "",
-                                    _rel_prefix: str = "") -> list[dict]:
-        """Recursively list a shared folder link by manually walking subfolders."""
+    def _search_video_files(self, service,
+                            folder_path: str) -> list[dict] | None:
+        """List videos under *folder_path* via files_search_v2.
+
+        The extension filter runs server-side, so non-video files are never
+        sent.  The search index lags behind recent uploads, hence opt-in via
+        DROPBOX_SEARCH_LISTING=1.  Returns None if search is rejected or
+        throttled, so the caller can fall back to a full recursive listing.
+        """
+        options = dropbox.files.SearchOptions(
+            path=folder_path or None,
+            max_results=1000,
+            file_status=dropbox.files.FileStatus.active,
+            file_extensions=[ext[1:] for ext in sorted(VIDEO_EXTENSIONS)],
+        )
+        files: list[dict] = []
+        try:
+            result = service.files_search_v2("", options=options)
+            while True:
+                for match in result.matches:
+                    if not match.metadata.is_metadata():
+                        continue
+                    entry = match.metadata.get_metadata()
+                    if type(entry) is FileMetadata:
+                        video = self._video_entry(entry, folder_path)
+                        if video is not None:
+                            files.append(video)
+                if not result.has_more:
+                    break
+                result = service.files_search_continue_v2(result.cursor)
+        except (ApiError, BadInputError, RateLimitError) as e:
+            print(f"  Dropbox search unavailable, listing instead: {e}")
+            return None
+
+        return files
+
+    @staticmethod
+    def _video_entry(entry, folder_path: str = "", *,
+                     file_id: str | None = None, rel_dir: str | None = None,
+                     web_view_link: str = "") -> dict | None:
+        """Build the listing dict for a FileMetadata, or None if not a video.
+
+        *file_id* and *rel_dir* default to entry.path_display and its
+        directory relative to *folder_path*; shared-link listings, where
+        path_display may be missing, pass their own.
+        """
+        dot = entry.name.rfind(".")
+        ext = entry.name[dot:].lower() if dot >= 0 else ""
+        if ext not in VIDEO_EXTENSIONS:
+            return None
+        if entry.name.startswith("._"):
+            return None
+
+        if file_id is None:
+            file_id = entry.path_display
+        if rel_dir is None:
+            rel_path = entry.path_display
+            if folder_path:
+                rel_path = rel_path[len(folder_path):]
+            rel_dir = rel_path.rpartition("/")[0].lstrip("/")
+            if rel_dir:
+                rel_dir += "/"
+
+        return {
+            "id": file_id,
+            "name": entry.name,
+            "size": entry.size,
+            "mimeType": "",
+            "createdTime": "",
+            "modifiedTime": (
+                entry.client_modified.isoformat() + "Z"
+                if entry.client_modified else ""
+            ),
+            "webViewLink": web_view_link,
+            "_folder_path": rel_dir,
+        }
+
+    def _list_shared_link_recursive(self, service,
+                                    shared_url: str) -> list[dict]:
+        """List a shared folder link, walking subfolders concurrently.
+
+        The Dropbox API does not support recursive=True with shared links,
+        so each folder is listed separately; sibling folders are listed in
+        parallel on a thread pool sharing the one Dropbox client.
+        """
+        files: list[dict] = []
+        with ThreadPoolExecutor(max_workers=LIST_WORKERS) as pool:
+            pending = {
+                pool.submit(self._list_one, service, shared_url, "", ""),
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    sub_files, subfolders = fut.result()
+                    files.extend(sub_files)
+                    for sf_path, rel in subfolders:
+                        pending.add(pool.submit(
+                            self._list_one, service, shared_url, sf_path, rel
+                        ))
+
+        return files
+
+    def _list_one(
+        self, service, shared_url: str, subfolder: str, rel_prefix: str,
+    ) -> tuple[list[dict], list[tuple[str, str]]]:
+        """List one folder of a shared link without recursing.
+
+        Returns (video_files, [(subfolder_path, rel_prefix), ...]).
+        """
         shared_link = dropbox.files.SharedLink(url=shared_url)
         files: list[dict] = []
+        subfolders: list[tuple[str, str]] = []
         try:
             result = service.files_list_folder(
-                path=subfolder, shared_link=shared_link
+                path=subfolder, shared_link=shared_link, **LIST_FOLDER_KWARGS
             )
         except ApiError as e:
             print(f"  Dropbox API error listing shared folder '{subfolder}': {e}")
-            return files
+            return files, subfolders
 
-        subfolders = []
         while True:
             for entry in result.entries:
-                if isinstance(entry, dropbox.files.FolderMetadata):
+                t = type(entry)
+                if t is FolderMetadata:
                     # path_display may be None for shared link listings;
                     # construct path from parent subfolder + entry name
                     sf_path = (
@@ -228,61 +486,40 @@ class DropboxProvider:
                         if entry.path_display
                         else f"{subfolder}/{entry.name}"
                     )
-                    subfolders.append((sf_path, entry.name))
-                elif isinstance(entry, dropbox.files.FileMetadata):
-                    ext = Path(entry.name).suffix.lower()
-                    if ext not in VIDEO_EXTENSIONS:
-                        continue
-                    if entry.name.startswith("._"):
-                        continue
+                    subfolders.append((sf_path, f"{rel_prefix}{entry.name}/"))
+                elif t is FileMetadata:
                     # Construct a stable path-based ID for use in subsequent API calls
-                    file_path = (
-                        entry.path_display
-                        if entry.path_display
-                        else f"{subfolder}/{entry.name}"
+                    video = self._video_entry(
+                        entry,
+                        file_id=entry.path_display or f"{subfolder}/{entry.name}",
+                        rel_dir=rel_prefix,
+                        web_view_link=shared_url,
                     )
-                    files.append({
-                        "id": file_path,
-                        "name": entry.name,
-                        "size": entry.size,
-                        "mimeType": "",
-                        "createdTime": "",
-                        "modifiedTime": (
-                            entry.client_modified.isoformat() + "Z"
-                            if entry.client_modified else ""
-                        ),
-                        "webViewLink": shared_url,
-                        "_folder_path": _rel_prefix,
-                    })
+                    if video is not None:
+                        files.append(video)
             if not result.has_more:
                 break
             result = service.files_list_folder_continue(result.cursor)
 
-        # Recurse into subfolders
-        for sf_path, sf_name in subfolders:
-            rel = f"{_rel_prefix}{sf_name}/"
-            files.extend(
-                self._list_shared_link_recursive(service, shared_url, sf_path, rel)
-            )
-
-        files.sort(key=lambda f: f["name"])
-        return files
+        return files, subfolders
 
     # -- download / stream ---------------------------------------------------
 
-    def stream_audio(self, service, file_path: str, audio_path: Path) -> None:
+    def stream_audio(self, service, file_path: str, audio_path: Path,
+                     mime_type: str | None = None) -> None:
         """Stream audio extraction from Dropbox.
 
         For owned files: uses a temporary link (fast, no auth headers needed).
         For shared folder files: uses the Dropbox content API URL with a Bearer
         token so ffmpeg can make range requests (required for moov-at-end MOV).
+        *mime_type* is accepted for interface parity and unused.
         """
         ffmpeg_args: list[str]
 
         try:
             link_result = service.files_get_temporary_link(file_path)
             url = link_result.link
-            ffmpeg_args = ["ffmpeg", "-i", url]
+            ffmpeg_args = ["ffmpeg", *HTTP_INPUT_ARGS, "-i", url]
         except ApiError:
             # Shared folder file — temp links are not available.
             # Use the sharing/get_shared_link_file API endpoint with auth headers.
@@ -300,18 +537,14 @@ class DropboxProvider:
                 f"Authorization: Bearer {token}\r\n"
                 f"Dropbox-API-Arg: {api_arg}\r\n"
             )
-            ffmpeg_args = ["ffmpeg", "-headers", headers_str, "-i", api_url]
+            ffmpeg_args = [
+                "ffmpeg", "-headers", headers_str, *HTTP_INPUT_ARGS, "-i", api_url,
+            ]
             print(f"  (using API streaming — shared folder file)")
 
         print(f"  Streaming audio extraction → {audio_path.name}...")
         result = subprocess.run(
-            ffmpeg_args + [
-                "-vn",
-                "-acodec", "libmp3lame",
-                "-q:a", "2",
-                "-y",
-                str(audio_path),
-            ],
+            ffmpeg_args + audio_encode_args() + ["-y", str(audio_path)],
             capture_output=True,
             text=True,
         )
@@ -326,9 +559,10 @@ class DropboxProvider:
     def download_file(self, service, file_path: str, dest_path: Path) -> None:
         """Download a Dropbox file to local disk.
 
-        For owned files: uses files_download_to_file (fast, simple).
+        For owned files: streams files_download.
         For shared folder files: uses the content API with Bearer token,
         same endpoint as stream_audio, reading the full response to disk.
+        Either way the file is written behind the network reads.
         """
         import urllib.request as _urlreq
 
@@ -347,14 +581,17 @@ class DropboxProvider:
                     "Dropbox-API-Arg": api_arg,
                 },
             )
-            with _urlreq.urlopen(req) as response, open(dest_path, "wb") as f:
-                while True:
-                    chunk = response.read(8 * 1024 * 1024)  # 8 MB chunks
-                    if not chunk:
-                        break
-                    f.write(chunk)
+            with _urlreq.urlopen(req) as response:
+                _write_behind(
+                    dest_path,
+                    iter(lambda: response.read(DOWNLOAD_CHUNK_SIZE), b""),
+                )
         else:
-            service.files_download_to_file(str(dest_path), file_path)
+            _, response = service.files_download(file_path)
+            with response:
+                _write_behind(
+                    dest_path, response.iter_content(DOWNLOAD_CHUNK_SIZE)
+                )
 
         print(
             f"  Downloaded: {dest_path.name}"
@@ -370,39 +607,100 @@ class DropboxProvider:
         file_size = local_path.stat().st_size
 
         if file_size <= CHUNK_SIZE:
+            # The SDK only takes bytes bodies (it rejects file-like/mmap
+            # objects so a retried request can be resent), and requests
+            # sends them without copying, so this read is the only copy.
             with open(local_path, "rb") as f:
                 service.files_upload(
                     f.read(), dest_path, mode=WriteMode.overwrite
                 )
         else:
-            # Chunked upload for large files
+            # Chunked upload for large files.  The next chunk is read from
+            # disk in the background while the current one uploads.
             with open(local_path, "rb") as f:
-                chunk = f.read(CHUNK_SIZE)
-                session = service.files_upload_session_start(chunk)
-                cursor = dropbox.files.UploadSessionCursor(
-                    session_id=session.session_id, offset=len(chunk)
-                )
-                while cursor.offset < file_size:
-                    chunk = f.read(CHUNK_SIZE)
-                    if cursor.offset + len(chunk) < file_size:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(
+                        f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL
+                    )
+                # closing() waits out the in-flight read if an upload call
+                # raises, before the file is closed.
+                with contextlib.closing(
+                    _prefetch_chunks(f, CHUNK_SIZE)
+                ) as chunks:
+                    chunk = next(chunks)
+                    session = service.files_upload_session_start(chunk)
+                    cursor = dropbox.files.UploadSessionCursor(
+                        session_id=session.session_id, offset=len(chunk)
+                    )
+                    commit = dropbox.files.CommitInfo(
+                        path=dest_path, mode=WriteMode.overwrite
+                    )
+                    # The size is known up front, so the last chunk rides
+                    # on the finish call without buffering one ahead (and
+                    # exact multiples need no trailing empty finish).
+                    for chunk in chunks:
+                        if cursor.offset + len(chunk) >= file_size:
+                            service.files_upload_session_finish(
+                                chunk, cursor, commit
+                            )
+                            break
                         service.files_upload_session_append_v2(chunk, cursor)
                         cursor.offset += len(chunk)
                     else:
-                        commit = dropbox.files.CommitInfo(
-                            path=dest_path, mode=WriteMode.overwrite
-                        )
+                        # File shrank while uploading; commit what was sent
                         service.files_upload_session_finish(
-                            chunk, cursor, commit
+                            b"", cursor, commit
                         )
-                        return dest_path
 
-                # Exact multiple of CHUNK_SIZE — finish with empty data
-                commit = dropbox.files.CommitInfo(
-                    path=dest_path, mode=WriteMode.overwrite
+        return dest_path
+
+    def upload_files_batch(self, service, folder_path: str,
+                           local_paths: list[Path]) -> list[str]:
+        """Upload several small files into *folder_path* with one commit.
+
+        Opens all upload sessions in one call, sends each file's data
+        concurrently, then commits every session with a single
+        files_upload_session_finish_batch_v2 — about N+2 round-trips
+        instead of one upload per file.  Files must each fit in one
+        CHUNK_SIZE request; use upload_file for larger ones.
+        Returns the destination paths, in input order.
+        """
+        dest_paths: list[str] = []
+        for i in range(0, len(local_paths), UPLOAD_BATCH_MAX):
+            group = local_paths[i:i + UPLOAD_BATCH_MAX]
+            for p in group:
+                if p.stat().st_size > CHUNK_SIZE:
+                    raise ValueError(
+                        f"{p.name} is larger than CHUNK_SIZE; use upload_file"
+                    )
+            started = service.files_upload_session_start_batch(len(group))
+
+            def _send(session_id: str, local_path: Path):
+                data = local_path.read_bytes()
+                cursor = dropbox.files.UploadSessionCursor(
+                    session_id=session_id, offset=0
+                )
+                service.files_upload_session_append_v2(data, cursor, close=True)
+                cursor.offset = len(data)
+                return dropbox.files.UploadSessionFinishArg(
+                    cursor=cursor,
+                    commit=dropbox.files.CommitInfo(
+                        path=f"{folder_path}/{local_path.name}",
+                        mode=WriteMode.overwrite,
+                    ),
                 )
-                service.files_upload_session_finish(b"", cursor, commit)
 
-        return dest_path
+            with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as pool:
+                entries = list(pool.map(_send, started.session_ids, group))
+            result = service.files_upload_session_finish_batch_v2(entries)
+            for entry, arg in zip(result.entries, entries):
+                if not entry.is_success():
+                    raise RuntimeError(
+                        f"Dropbox batch upload failed for {arg.commit.path}:"
+                        f" {entry.get_failure()}"
+                    )
+                dest_paths.append(arg.commit.path)
+        return dest_paths
 
     # -- manifest ------------------------------------------------------------
 
@@ -412,7 +710,7 @@ class DropboxProvider:
         manifest_path = f"{folder_path}/manifest.json"
         try:
             _, response = service.files_download(manifest_path)
-            manifest = json.loads(response.content)
+            manifest = manifest_loads(response.content)
             return manifest, manifest_path
         except ApiError:
             return {
@@ -425,24 +723,85 @@ class DropboxProvider:
                       manifest_file_id: str | None) -> str:
         """Write manifest.json to Dropbox."""
         manifest_path = f"{folder_path}/manifest.json"
-        data = json.dumps(manifest, indent=2).encode("utf-8")
+        data = manifest_dumps(manifest)
         service.files_upload(data, manifest_path, mode=WriteMode.overwrite)
         return manifest_path
 
     # -- subfolders ----------------------------------------------------------
 
     def ensure_subfolder(self, service, parent_path: str, name: str) -> str:
-        """Find or create a subfolder under parent_path.  Returns the path."""
+        """Find or create a subfolder under parent_path.  Returns the path.
+
+        Existence is checked against one cached listing of parent_path, so
+        several subfolders of the same parent cost a single round-trip.
+        """
         folder_path = f"{parent_path}/{name}"
-        try:
-            service.files_get_metadata(folder_path)
-        except ApiError:
+        children = self._child_folders(service, parent_path)
+        if name.lower() not in children:
             try:
                 service.files_create_folder_v2(folder_path)
             except ApiError:
                 pass  # May already exist due to race
+            children.add(name.lower())
+            # A folder we just created has no children to list
+            self._children_cache.setdefault(folder_path.lower(), set())
         return folder_path
 
+    def ensure_subfolders_batch(self, service, parent_path: str,
+                                names: list[str]) -> dict[str, str]:
+        """Find or create several subfolders of parent_path.
+
+        The missing ones are created with one files_create_folder_batch
+        call, polling files_create_folder_batch_check if Dropbox runs it
+        as a background job.  Returns {name: folder_path}.
+        """
+        paths = {name: f"{parent_path}/{name}" for name in names}
+        children = self._child_folders(service, parent_path)
+        missing = [n for n in paths if n.lower() not in children]
+        for i in range(0, len(missing), CREATE_FOLDER_BATCH_MAX):
+            group = missing[i:i + CREATE_FOLDER_BATCH_MAX]
+            try:
+                launch = service.files_create_folder_batch(
+                    [paths[n] for n in group]
+                )
+                if launch.is_async_job_id():
+                    job_id = launch.get_async_job_id()
+                    delay = 0.1
+                    while True:
+                        time.sleep(delay)
+                        status = service.files_create_folder_batch_check(job_id)
+                        if not status.is_in_progress():
+                            break
+                        delay = min(delay * 2, 2.0)
+            except ApiError:
+                pass  # Some may already exist due to race, as in ensure_subfolder
+            # Per-entry failures (usually "already exists") are ignored too
+            for n in group:
+                children.add(n.lower())
+                self._children_cache.setdefault(paths[n].lower(), set())
+        return paths
+
+    def _child_folders(self, service, parent_path: str) -> set[str]:
+        """Return the (cached, lowercased) subfolder names of parent_path."""
+        key = parent_path.lower()  # Dropbox paths are case-insensitive
+        children = self._children_cache.get(key)
+        if children is not None:
+            return children
+        children = set()
+        try:
+            result = service.files_list_folder(parent_path, **LIST_FOLDER_KWARGS)
+            while True:
+                for entry in result.entries:
+                    if type(entry) is FolderMetadata:
+                        children.add(entry.name.lower())
+                if not result.has_more:
+                    break
+                result = service.files_list_folder_continue(result.cursor)
+        except ApiError:
+            pass  # Parent missing/unlistable: treat as empty, create below
+        self._children_cache[key] = children
+        return children
+
     def get_folder_name(self, service, folder_ref: str) -> str:
         """Return the display name of the folder.
 
@@ -450,23 +809,57 @@ class DropboxProvider:
         For bare paths, returns the last path component.
         """
         if folder_ref.startswith("https://"):
-            meta = service.sharing_get_shared_link_metadata(folder_ref)
-            return meta.name
+            name = self._folder_name_cache.get(folder_ref)
+            if name is None:
+                meta = service.sharing_get_shared_link_metadata(folder_ref)
+                name = self._folder_name_cache[folder_ref] = meta.name
+            return name
         return Path(folder_ref.rstrip("/")).name or folder_ref
 
     def list_existing_transcripts(self, service, folder_path: str) -> set[str]:
-        """Return base-names that already have transcripts."""
+        """Return base-names that already have transcripts.
+
+        The result and the listing cursor are cached together per folder
+        in one atomically written file, so later runs only fetch changes
+        via files_list_folder_continue.
+        Falls back to a full listing when there is no cursor or Dropbox
+        rejects it (e.g. a cursor reset).  Audit/fallback path: batch
+        resumes skip files by the manifest's source IDs.
+        """
+        index = _read_json(self.transcript_index_path)
+        saved = index.get(folder_path)
         names: set[str] = set()
+        result = None
+        # Only continue from a cursor whose names were saved with it;
+        # deltas applied to any other base would lose stems for good.
+        if (isinstance(saved, dict) and isinstance(saved.get("cursor"), str)
+                and isinstance(saved.get("names"), list)):
+            names = set(saved["names"])
+            try:
+                result = service.files_list_folder_continue(saved["cursor"])
+            except ApiError:
+                result = None
         try:
-            result = service.files_list_folder(folder_path)
+            if result is None:
+                names = set()
+                result = service.files_list_folder(
+                    folder_path, **LIST_FOLDER_KWARGS
+                )
             while True:
                 for entry in result.entries:
-                    if isinstance(entry, dropbox.files.FileMetadata):
-                        if entry.name.endswith(".txt"):
-                            names.add(Path(entry.name).stem)
+                    if not entry.name.endswith(".txt"):
+                        continue
+                    t = type(entry)
+                    if t is DeletedMetadata:
+                        names.discard(Path(entry.name).stem)
+                    elif t is FileMetadata:
+                        names.add(Path(entry.name).stem)
                 if not result.has_more:
                     break
                 result = service.files_list_folder_continue(result.cursor)
         except ApiError:
-            pass
+            return names
+
+        index[folder_path] = {"cursor": result.cursor, "names": sorted(names)}
+        _write_json_atomic(self.transcript_index_path, index)
         return names